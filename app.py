@@ -3,14 +3,18 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Tuple, Optional
 from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
+import re
 import traceback
 
 import pandas as pd
 import streamlit as st
-import pycountry
+import xlsxwriter
 
+from countries import COUNTRIES
 from storage import Storage
 from steam_sources import (
+    FALLBACK_US_TAGS,
     fetch_global_tags,
     fetch_appids,
     fetch_upcoming_appids,
@@ -18,7 +22,7 @@ from steam_sources import (
     fetch_reviews,
     fetch_wishlist_estimate_gamedata,
     fetch_followers,
-    parse_release,
+    release_timestamp,
     release_date_text,
     extract_genre_category_terms,
 )
@@ -27,7 +31,11 @@ from steam_sources import (
 # Page config + header
 # -----------------------------------------------------------------------------
 st.set_page_config(page_title="Steam Radar", layout="wide")
-storage = Storage()
+
+# One Storage per browser session (schema init runs once), not one per rerun
+if "_storage" not in st.session_state:
+    st.session_state["_storage"] = Storage()
+storage = st.session_state["_storage"]
 
 st.markdown(
     """
@@ -43,8 +51,9 @@ st.markdown(
 # -----------------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------------
+@st.cache_data
 def _build_all_country_options() -> Tuple[List[str], Dict[str, str]]:
-    items = [(c.alpha_2, c.name) for c in pycountry.countries]
+    items = list(COUNTRIES)
 
     # Useful Steam-adjacent extras
     extras = [
@@ -64,6 +73,32 @@ def _build_all_country_options() -> Tuple[List[str], Dict[str, str]]:
     return labels, label_to_cc
 
 
+class _FallbackTags(Exception):
+    """Carries the static fallback tag list out of _cached_global_tags, so it is not cached."""
+
+    def __init__(self, tags: List[Dict[str, Any]]):
+        super().__init__("Steam global tags unavailable; using the static fallback list")
+        self.tags = tags
+
+
+@st.cache_data(ttl=60 * 60)
+def _cached_global_tags(cc: str) -> List[Dict[str, Any]]:
+    # Sidebar renders on every rerun; keep the tag list in memory instead of re-fetching it.
+    # st.cache_data does not store exceptions: a transient Steam failure must not pin the
+    # fallback list for every session for an hour (the next rerun retries).
+    tags = fetch_global_tags(storage, cc)
+    if [t["name"] for t in tags] == FALLBACK_US_TAGS:
+        raise _FallbackTags(tags)
+    return tags
+
+
+def _global_tags(cc: str) -> List[Dict[str, Any]]:
+    try:
+        return _cached_global_tags(cc)
+    except _FallbackTags as exc:
+        return exc.tags
+
+
 ALL_COUNTRY_OPTIONS, COUNTRY_LABEL_TO_CC = _build_all_country_options()
 CC_TO_COUNTRY_LABEL = {v: k for k, v in COUNTRY_LABEL_TO_CC.items()}
 ALL_CC = sorted(list(CC_TO_COUNTRY_LABEL.keys()))
@@ -79,7 +114,7 @@ def _selected_ccs_from_labels(labels: List[str]) -> List[str]:
 
 def classify_upcoming(
     data: Dict[str, Any],
-    now_utc: datetime,
+    now_ts: float,
     window_days: int,
     include_unknown: bool,
 ) -> Tuple[bool, Optional[float]]:
@@ -87,18 +122,95 @@ def classify_upcoming(
     Upcoming inclusion rules:
     - If a concrete release datetime exists: keep if 0 <= days_until <= window_days
     - If no concrete date: keep only if include_unknown is True
-    Returns (keep, days_until)
+    `now_ts` is POSIX seconds (UTC). Returns (keep, days_until)
     """
-    rel = parse_release(data)
-    if rel is None:
+    rel_ts = release_timestamp(data)
+    if rel_ts is None:
         return (include_unknown, None)
 
-    days_until = (rel - now_utc).total_seconds() / 86400.0
+    days_until = (rel_ts - now_ts) / 86400.0
     if 0 <= days_until <= float(window_days):
         return (True, days_until)
     return (False, days_until)
 
 
+def _compile_terms(terms: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile include/exclude terms once per scan into a single escaped alternation, so each
+    app's text blob is checked for all terms by one C-level re.search (substring semantics,
+    like `in`). Returns None when there are no terms.
+    """
+    if not terms:
+        return None
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+def _to_xlsx_bytes(df: pd.DataFrame, sheet_name: str) -> bytes:
+    """
+    Stream df into an .xlsx using xlsxwriter's constant_memory mode (rows are flushed to disk
+    as soon as the next row starts, instead of holding every cell as a Python object).
+    constant_memory requires row-by-row writes; pandas' to_excel writes column by column and
+    would silently drop cells, so rows are written directly here.
+    """
+    buffer = BytesIO()
+    workbook = xlsxwriter.Workbook(buffer, {"constant_memory": True, "default_date_format": "yyyy-mm-dd"})
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(c) for c in df.columns], workbook.add_format({"bold": True}))
+
+    # Missing values -> blank cells (xlsxwriter rejects NaN numbers)
+    body = df.astype(object).where(df.notna(), None)
+    for row_idx, row in enumerate(body.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, row)
+
+    workbook.close()
+    return buffer.getvalue()
+
+
+def _df_fingerprint(df: pd.DataFrame) -> bytes:
+    """Content hash of a result table (columns + cell values), used as the export cache key."""
+    col_key = "\x1f".join(map(str, df.columns)).encode("utf-8")
+    return col_key + pd.util.hash_pandas_object(df, index=False).values.tobytes()
+
+
+@st.cache_data(max_entries=8)
+def _encode_export(df_key: bytes, export_format: str, _df: pd.DataFrame) -> bytes:
+    # _df is excluded from Streamlit's arg hashing; df_key (see _df_fingerprint) identifies it
+    if export_format == "Export as .csv":
+        return _df.to_csv(index=False).encode("utf-8")
+    return _to_xlsx_bytes(_df, sheet_name="Steam Radar")
+
+
+# Upper bound on countries whose app lists are fetched concurrently
+MAX_SCAN_WORKERS = 8
+# appdetails are fetched once per app (not per country) using this store region
+APPDETAILS_CC = "US"
+# Upper bound on concurrent per-app enrichment requests (wishlists / followers)
+MAX_ENRICH_WORKERS = 16
+
+
+def _fetch_enrichments(fetchers: Dict[str, Any], appids: List[int]) -> Dict[str, List[Future]]:
+    """
+    Call every fetcher(storage, appid) for every AppID on one shared thread pool, interleaved
+    per app (e.g. an app's wishlist and follower requests are in flight together).
+    Returns {column: completed futures in AppID order}; callers collect each column's results
+    separately, so a failing fetcher only loses its own column.
+    """
+    futures: Dict[str, List[Future]] = {col: [] for col in fetchers}
+    if not appids or not fetchers:
+        return futures
+    workers = min(MAX_ENRICH_WORKERS, len(appids) * len(fetchers))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for a in appids:
+            for col, fetch_fn in fetchers.items():
+                futures[col].append(pool.submit(fetch_fn, storage, int(a)))
+    return futures
+
+
+def _fetch_per_app(fetch_fn, appids: List[int]) -> List[Any]:
+    """Single-fetcher shorthand for _fetch_enrichments; results in AppID order (raises on failure)."""
+    return [f.result() for f in _fetch_enrichments({"values": fetch_fn}, appids)["values"]]
+
+
 # -----------------------------------------------------------------------------
 # Country tiers (edit anytime)
 # -----------------------------------------------------------------------------
@@ -153,6 +265,8 @@ if "export_format" not in st.session_state:
 # Persisted scan outputs so reruns (export dropdown etc.) don't clear results
 if "last_display_df" not in st.session_state:
     st.session_state["last_display_df"] = None
+if "last_display_key" not in st.session_state:
+    st.session_state["last_display_key"] = None
 if "last_mode_label" not in st.session_state:
     st.session_state["last_mode_label"] = None
 if "last_run_date" not in st.session_state:
@@ -209,6 +323,54 @@ def _remove_term(term: str, key_list: str):
     st.session_state[key_list] = [t for t in st.session_state[key_list] if t != term]
 
 
+@st.fragment
+def _term_chips(label: str, key_in: str, add_key: str, key_list: str, rm_prefix: str, empty_caption: str):
+    """
+    Text input + Add button + removable chips for one term list.
+    Runs as a fragment: adding/removing a chip reruns only this block, not the whole app.
+    """
+    c1, c2 = st.columns([3, 1])
+    with c1:
+        st.text_input(label, key=key_in, placeholder="Type a term and click Add")
+    with c2:
+        st.button("Add", key=add_key, on_click=_add_term, args=(key_in, key_list))
+
+    if st.session_state[key_list]:
+        cols = st.columns(4)
+        for i, term in enumerate(st.session_state[key_list]):
+            with cols[i % 4]:
+                st.button(f"✕ {term}", key=f"{rm_prefix}_{term}_{i}", on_click=_remove_term, args=(term, key_list))
+    else:
+        st.caption(empty_caption)
+
+
+@st.fragment
+def _export_controls(display_df: pd.DataFrame, base_name: str):
+    """Export format dropdown + download button; runs as a fragment so neither reruns the app."""
+    export_format = st.selectbox(
+        "Export format",
+        ["Export as .csv", "Export as .xlsx"],
+        index=0 if st.session_state["export_format"] == "Export as .csv" else 1,
+        key="export_format",
+    )
+
+    # Encoded once per (table, format); flipping the dropdown back and forth is a cache hit
+    data_bytes = _encode_export(st.session_state["last_display_key"], export_format, display_df)
+    if export_format == "Export as .csv":
+        file_name = f"{base_name}.csv"
+        mime_type = "text/csv"
+    else:
+        file_name = f"{base_name}.xlsx"
+        mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    st.download_button(
+        label="Download export",
+        data=data_bytes,
+        file_name=file_name,
+        mime=mime_type,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Sidebar UI
 # -----------------------------------------------------------------------------
@@ -273,7 +435,7 @@ with st.sidebar:
 
     # If tag fetch fails, we keep the UI usable and log exception
     try:
-        global_tags = fetch_global_tags(storage, cc_for_tags)
+        global_tags = _global_tags(cc_for_tags)
         tag_names_ordered = [t["name"] for t in global_tags]
     except Exception:
         st.session_state["last_exceptions"].append(
@@ -316,33 +478,14 @@ with st.sidebar:
     st.subheader("Text include/exclude (optional)")
     st.caption("Matches against: name, developer, publisher, plus genres/categories from appdetails.")
 
-    c1, c2 = st.columns([3, 1])
-    with c1:
-        st.text_input("Include term (OR match)", key="include_term_input", placeholder="Type a term and click Add")
-    with c2:
-        st.button("Add", key="add_include_btn", on_click=_add_term, args=("include_term_input", "include_terms_list"))
-
-    if st.session_state["include_terms_list"]:
-        cols = st.columns(4)
-        for i, term in enumerate(st.session_state["include_terms_list"]):
-            with cols[i % 4]:
-                st.button(f"✕ {term}", key=f"rm_inc_{term}_{i}", on_click=_remove_term, args=(term, "include_terms_list"))
-    else:
-        st.caption("No include terms yet.")
-
-    c3, c4 = st.columns([3, 1])
-    with c3:
-        st.text_input("Exclude term (hard filter)", key="exclude_term_input", placeholder="Type a term and click Add")
-    with c4:
-        st.button("Add", key="add_exclude_btn", on_click=_add_term, args=("exclude_term_input", "exclude_terms_list"))
-
-    if st.session_state["exclude_terms_list"]:
-        cols = st.columns(4)
-        for i, term in enumerate(st.session_state["exclude_terms_list"]):
-            with cols[i % 4]:
-                st.button(f"✕ {term}", key=f"rm_exc_{term}_{i}", on_click=_remove_term, args=(term, "exclude_terms_list"))
-    else:
-        st.caption("No exclude terms yet.")
+    _term_chips(
+        "Include term (OR match)", "include_term_input", "add_include_btn", "include_terms_list", "rm_inc",
+        empty_caption="No include terms yet.",
+    )
+    _term_chips(
+        "Exclude term (hard filter)", "exclude_term_input", "add_exclude_btn", "exclude_terms_list", "rm_exc",
+        empty_caption="No exclude terms yet.",
+    )
 
     include_terms = st.session_state["include_terms_list"]
     exclude_terms = st.session_state["exclude_terms_list"]
@@ -367,8 +510,20 @@ if run:
     # Reset exceptions for THIS run (keep history if you prefer; tell me)
     st.session_state["last_exceptions"] = []
 
-    now = datetime.now(timezone.utc)
-    rows: List[Dict[str, Any]] = []
+    # One timestamp per scan; per-app date checks are float arithmetic against it
+    now_ts = datetime.now(timezone.utc).timestamp()
+    # Results are collected column-wise (one list per column) and handed to pandas once at the end
+    if mode == "New releases":
+        row_columns = [
+            "AppID", "Name", "Store", "Developer", "Publisher", "Country", "Release Date",
+            "Genres/Categories", "Reviews/day", "% Positive", "_reviews_total", "_reviews_pos",
+        ]
+    else:
+        row_columns = [
+            "AppID", "Name", "Store", "Developer", "Publisher", "Country", "Release",
+            "Days Until", "Genres/Categories",
+        ]
+    cols: Dict[str, List[Any]] = {c: [] for c in row_columns}
 
     active_countries = countries[:] if countries else []
     if not active_countries:
@@ -379,6 +534,9 @@ if run:
     if not st.session_state["all_tags_no_filter"]:
         selected_tags_lower = {t.strip().lower() for t in include_tags if t.strip()}
 
+    include_re = _compile_terms(include_terms)
+    exclude_re = _compile_terms(exclude_terms)
+
     processed_apps = 0
     progress = st.progress(0)
     status = st.empty()
@@ -403,12 +561,12 @@ if run:
         progress.progress(pct)
         status.write(f"Scanning… {cc} | Processed apps: {processed_apps}/{max_apps}")
 
-    for cc in active_countries:
-        if processed_apps >= max_apps:
-            break
-
-        _update_ui(cc)
-
+    def _fetch_country_appids(cc: str) -> Dict[str, Any]:
+        """
+        Fetch one country's app list, trimmed to its budget.
+        Runs on a worker thread: must not touch st.* / session_state, so a failure is
+        returned to the main thread for logging instead of being appended here.
+        """
         try:
             if mode == "Upcoming":
                 appids = fetch_upcoming_appids(storage=storage, country=cc, pages=pages, per_page=per_page)
@@ -422,28 +580,50 @@ if run:
                     include_tagids=[],
                 )
         except Exception:
+            return {"cc": cc, "appids": [], "trace": traceback.format_exc()}
+        return {"cc": cc, "appids": appids[:per_country_budget], "trace": None}
+
+    # App lists are fetched concurrently (pure network wait). pool.map returns them in selection
+    # order, and all session_state writes stay on this thread.
+    status.write(f"Fetching app lists for {len(active_countries)} countries…")
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(active_countries))) as pool:
+        country_results = list(pool.map(_fetch_country_appids, active_countries))
+
+    appids_by_cc: Dict[str, List[int]] = {}
+    for result in country_results:
+        if result["trace"] is not None:
             dbg["exceptions"] += 1
             st.session_state["last_exceptions"].append(
                 {
                     "ts": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
                     "stage": "fetch_appids" if mode != "Upcoming" else "fetch_upcoming_appids",
-                    "country": cc,
+                    "country": result["cc"],
                     "appid": None,
                     "error": "Failed fetching app list",
-                    "trace": traceback.format_exc(),
+                    "trace": result["trace"],
                 }
             )
             continue
-
-        remaining_global = max(0, max_apps - processed_apps)
-        budget = min(per_country_budget, remaining_global)
-        appids = appids[:budget]
-
+        appids_by_cc[result["cc"]] = result["appids"]
+
+    # The same games show up in most countries' lists, and the appdetails fields used below
+    # (type, name, developers, genres, release date) don't depend on cc - fetch each app once
+    # from APPDETAILS_CC. Apps that store doesn't sell (region-locked titles) come back empty
+    # and are re-fetched from the store of each country that listed them.
+    def _details_progress(label: str):
+        def _report(done: int, total: int):
+            if done == total or done % 25 == 0:
+                progress.progress(min(1.0, done / max(1, total)))
+                status.write(f"Fetching appdetails{label}… {done}/{total}")
+        return _report
+
+    def _fetch_details(appids: List[int], cc: str, label: str) -> Optional[Dict[int, Any]]:
         try:
-            details_map = fetch_appdetails_batch(
+            return fetch_appdetails_batch(
                 storage, appids, cc,
                 batch_size=batch_size,
                 per_request_sleep=per_request_sleep,
+                on_progress=_details_progress(label),
             )
         except Exception:
             dbg["exceptions"] += 1
@@ -457,7 +637,36 @@ if run:
                     "trace": traceback.format_exc(),
                 }
             )
+            return None
+
+    unique_appids = list(dict.fromkeys(a for appids in appids_by_cc.values() for a in appids))
+    details_map = _fetch_details(unique_appids, APPDETAILS_CC, "")
+    global_ok = details_map is not None
+    if details_map is None:
+        # The shared batch failed: every app is a miss and goes through its own country's store below
+        details_map = {}
+    regional_details: Dict[str, Dict[int, Any]] = {}
+    for cc, appids in list(appids_by_cc.items()):
+        if cc == APPDETAILS_CC and global_ok:
+            continue
+        retry = [a for a in appids if details_map.get(a) is None]
+        if not retry:
             continue
+        fetched = _fetch_details(retry, cc, f" ({cc} store)")
+        if fetched is None:
+            # Without details nothing can be classified; skip this country (as a failed batch always did)
+            del appids_by_cc[cc]
+        else:
+            regional_details[cc] = fetched
+
+    for cc, appids in appids_by_cc.items():
+        if processed_apps >= max_apps:
+            break
+
+        _update_ui(cc)
+
+        remaining_global = max(0, max_apps - processed_apps)
+        appids = appids[:remaining_global]
 
         for appid in appids:
             processed_apps += 1
@@ -466,6 +675,8 @@ if run:
 
             try:
                 data = details_map.get(appid)
+                if data is None:
+                    data = regional_details.get(cc, {}).get(appid)
                 if data is None:
                     dbg["missing_details"] += 1
                     continue
@@ -474,34 +685,35 @@ if run:
                     dbg["non_game_type"] += 1
                     continue
 
+                # Already stripped + de-duped by extract_genre_category_terms; lowercase each once
+                genre_terms = extract_genre_category_terms(data)
+                genre_terms_lower = [t.lower() for t in genre_terms]
+
+                if selected_tags_lower and selected_tags_lower.isdisjoint(genre_terms_lower):
+                    dbg["filtered_tag_or"] += 1
+                    continue
+
+                # Only apps that survived the cheap checks above pay for string building
                 name = data.get("name") or ""
                 developer = ", ".join(data.get("developers", []) or [])
                 publisher = ", ".join(data.get("publishers", []) or [])
-                genre_terms = extract_genre_category_terms(data)
                 genres_joined = ", ".join(genre_terms)
+                blob = " ".join([name.lower(), developer.lower(), publisher.lower(), *genre_terms_lower])
 
-                if selected_tags_lower:
-                    game_terms_lower = {t.strip().lower() for t in genre_terms if t.strip()}
-                    if game_terms_lower.isdisjoint(selected_tags_lower):
-                        dbg["filtered_tag_or"] += 1
-                        continue
-
-                blob = " ".join([name, developer, publisher] + genre_terms).lower()
-
-                if include_terms and not any(t in blob for t in include_terms):
+                if include_re is not None and not include_re.search(blob):
                     dbg["filtered_include_terms"] += 1
                     continue
-                if exclude_terms and any(t in blob for t in exclude_terms):
+                if exclude_re is not None and exclude_re.search(blob):
                     dbg["filtered_exclude_terms"] += 1
                     continue
 
                 if mode == "New releases":
-                    release_dt = parse_release(data)
-                    if release_dt is None:
+                    release_ts = release_timestamp(data)
+                    if release_ts is None:
                         dbg["newrelease_no_date"] += 1
                         continue
 
-                    age_days = (now - release_dt).total_seconds() / 86400.0
+                    age_days = (now_ts - release_ts) / 86400.0
                     if age_days < 0 or age_days > window_days:
                         dbg["newrelease_wrong_window"] += 1
                         continue
@@ -510,27 +722,24 @@ if run:
                     velocity = reviews["reviews"] / max(1, review_days)
                     positivity = (reviews["positive"] / reviews["reviews"] * 100) if reviews["reviews"] > 0 else None
 
-                    rows.append(
-                        {
-                            "AppID": appid,
-                            "Name": name,
-                            "Store": f"https://store.steampowered.com/app/{appid}/",
-                            "Developer": developer,
-                            "Publisher": publisher,
-                            "Country": cc,
-                            "Release Date": release_dt.date(),
-                            "Genres/Categories": genres_joined,
-                            "Reviews/day": round(velocity, 2),
-                            "% Positive": None if positivity is None else round(positivity, 1),
-                            "_reviews_total": int(reviews["reviews"]),
-                            "_reviews_pos": int(reviews["positive"]),
-                        }
-                    )
+                    # Everything that can raise is computed above, so columns never end up ragged
+                    cols["AppID"].append(appid)
+                    cols["Name"].append(name)
+                    cols["Store"].append(f"https://store.steampowered.com/app/{appid}/")
+                    cols["Developer"].append(developer)
+                    cols["Publisher"].append(publisher)
+                    cols["Country"].append(cc)
+                    cols["Release Date"].append(datetime.fromtimestamp(release_ts, tz=timezone.utc).date())
+                    cols["Genres/Categories"].append(genres_joined)
+                    cols["Reviews/day"].append(round(velocity, 2))
+                    cols["% Positive"].append(None if positivity is None else round(positivity, 1))
+                    cols["_reviews_total"].append(int(reviews["reviews"]))
+                    cols["_reviews_pos"].append(int(reviews["positive"]))
                     dbg["kept"] += 1
                 else:
                     keep, days_until = classify_upcoming(
                         data=data,
-                        now_utc=now,
+                        now_ts=now_ts,
                         window_days=window_days,
                         include_unknown=include_unknown_upcoming,
                     )
@@ -538,19 +747,17 @@ if run:
                         dbg["upcoming_classify_reject"] += 1
                         continue
 
-                    rows.append(
-                        {
-                            "AppID": appid,
-                            "Name": name,
-                            "Store": f"https://store.steampowered.com/app/{appid}/",
-                            "Developer": developer,
-                            "Publisher": publisher,
-                            "Country": cc,
-                            "Release": release_date_text(data) or "Coming Soon",
-                            "Days Until": days_until,
-                            "Genres/Categories": genres_joined,
-                        }
-                    )
+                    release_text = release_date_text(data) or "Coming Soon"
+
+                    cols["AppID"].append(appid)
+                    cols["Name"].append(name)
+                    cols["Store"].append(f"https://store.steampowered.com/app/{appid}/")
+                    cols["Developer"].append(developer)
+                    cols["Publisher"].append(publisher)
+                    cols["Country"].append(cc)
+                    cols["Release"].append(release_text)
+                    cols["Days Until"].append(days_until)
+                    cols["Genres/Categories"].append(genres_joined)
                     dbg["kept"] += 1
 
             except Exception:
@@ -572,37 +779,48 @@ if run:
     progress.progress(1.0)
     status.write(f"Done. Processed apps: {processed_apps}/{max_apps}")
 
-    if not rows:
+    if not cols["AppID"]:
         st.warning("No results found. Increase pages/max apps, change countries, or relax filters.")
         # Still persist debug + exceptions
         st.session_state["last_dbg"] = dbg
         st.stop()
 
-    df = pd.DataFrame(rows)
-    countries_agg = df.groupby("AppID")["Country"].apply(lambda s: ", ".join(sorted(set(s)))).rename("Countries")
+    df = pd.DataFrame(cols)
+    # Dedupe + sort as whole-frame ops, so the per-group step is a plain str.join
+    # (no Python set/sorted lambda per AppID).
+    countries_agg = (
+        df[["AppID", "Country"]]
+        .drop_duplicates()
+        .sort_values(["AppID", "Country"])
+        .groupby("AppID", sort=False)["Country"]
+        .agg(", ".join)
+        .rename("Countries")
+    )
 
     if mode == "New releases":
-        first_fields = df.groupby("AppID").agg(
-            {
-                "Name": "first",
-                "Store": "first",
-                "Developer": "first",
-                "Publisher": "first",
-                "Release Date": "first",
-                "Genres/Categories": "first",
+        # Every per-AppID reduction in one groupby pass, on pandas' built-in (Cython) kernels
+        out = df.groupby("AppID").agg(
+            **{
+                "Name": ("Name", "first"),
+                "Store": ("Store", "first"),
+                "Developer": ("Developer", "first"),
+                "Publisher": ("Publisher", "first"),
+                "Release Date": ("Release Date", "first"),
+                "Genres/Categories": ("Genres/Categories", "first"),
+                "Reviews/day": ("Reviews/day", "max"),
+                "_reviews_total": ("_reviews_total", "sum"),
+                "_reviews_pos": ("_reviews_pos", "sum"),
             }
         )
-        reviews_day_max = df.groupby("AppID")["Reviews/day"].max().rename("Reviews/day")
-
-        totals = df.groupby("AppID")[["_reviews_total", "_reviews_pos"]].sum()
-        pct_pos = (totals["_reviews_pos"] / totals["_reviews_total"] * 100).round(1).rename("% Positive")
-
-        out = pd.concat([first_fields, countries_agg, reviews_day_max, pct_pos], axis=1).reset_index()
+        # Index-aligned column inserts instead of a pd.concat of separate groupby results
+        out.insert(out.columns.get_loc("Reviews/day"), "Countries", countries_agg)
+        out["% Positive"] = (out["_reviews_pos"] / out["_reviews_total"] * 100).round(1)
+        out = out.drop(columns=["_reviews_total", "_reviews_pos"]).reset_index()
 
         out["Wishlists (est.)"] = None
         if show_wishlists:
             try:
-                out["Wishlists (est.)"] = out["AppID"].apply(lambda a: fetch_wishlist_estimate_gamedata(storage, int(a)))
+                out["Wishlists (est.)"] = _fetch_per_app(fetch_wishlist_estimate_gamedata, out["AppID"].tolist())
             except Exception:
                 dbg["exceptions"] += 1
                 st.session_state["last_exceptions"].append(
@@ -632,7 +850,7 @@ if run:
         out["Followers"] = None
         if show_followers:
             try:
-                out["Followers"] = out["AppID"].apply(lambda a: fetch_followers(storage, int(a)))
+                out["Followers"] = _fetch_per_app(fetch_followers, out["AppID"].tolist())
             except Exception:
                 dbg["exceptions"] += 1
                 st.session_state["last_exceptions"].append(
@@ -647,35 +865,19 @@ if run:
                 )
 
     else:
-        first_fields = df.groupby("AppID").agg(
-            {
-                "Name": "first",
-                "Store": "first",
-                "Developer": "first",
-                "Publisher": "first",
-                "Release": "first",
-                "Days Until": "min",
-                "Genres/Categories": "first",
+        out = df.groupby("AppID").agg(
+            **{
+                "Name": ("Name", "first"),
+                "Store": ("Store", "first"),
+                "Developer": ("Developer", "first"),
+                "Publisher": ("Publisher", "first"),
+                "Release": ("Release", "first"),
+                "Days Until": ("Days Until", "min"),
+                "Genres/Categories": ("Genres/Categories", "first"),
             }
         )
-        out = pd.concat([first_fields, countries_agg], axis=1).reset_index()
-
-        out["Wishlists (est.)"] = None
-        if show_wishlists:
-            try:
-                out["Wishlists (est.)"] = out["AppID"].apply(lambda a: fetch_wishlist_estimate_gamedata(storage, int(a)))
-            except Exception:
-                dbg["exceptions"] += 1
-                st.session_state["last_exceptions"].append(
-                    {
-                        "ts": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
-                        "stage": "wishlists",
-                        "country": None,
-                        "appid": None,
-                        "error": "Failed fetching wishlist estimates",
-                        "trace": traceback.format_exc(),
-                    }
-                )
+        out["Countries"] = countries_agg
+        out = out.reset_index()
 
         out["_days_sort"] = pd.to_numeric(out["Days Until"], errors="coerce")
         out["_unknown"] = out["_days_sort"].isna().astype(int)
@@ -687,19 +889,34 @@ if run:
 
         out = out.drop(columns=["_days_sort", "_unknown"], errors="ignore")
 
-        out["Followers"] = None
+        # Upcoming ordering doesn't depend on wishlists, so both enrichments are fetched
+        # together, and only for the rows actually shown
+        enrich_fetchers: Dict[str, Any] = {}
+        if show_wishlists:
+            enrich_fetchers["Wishlists (est.)"] = fetch_wishlist_estimate_gamedata
         if show_followers:
+            enrich_fetchers["Followers"] = fetch_followers
+        # column -> (stage, error) logged when that column's fetches fail
+        enrich_errors = {
+            "Wishlists (est.)": ("wishlists", "Failed fetching wishlist estimates"),
+            "Followers": ("followers", "Failed fetching followers"),
+        }
+
+        out["Wishlists (est.)"] = None
+        out["Followers"] = None
+        for col, futs in _fetch_enrichments(enrich_fetchers, out["AppID"].tolist()).items():
             try:
-                out["Followers"] = out["AppID"].apply(lambda a: fetch_followers(storage, int(a)))
+                out[col] = [f.result() for f in futs]
             except Exception:
+                stage, error = enrich_errors[col]
                 dbg["exceptions"] += 1
                 st.session_state["last_exceptions"].append(
                     {
                         "ts": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
-                        "stage": "followers",
+                        "stage": stage,
                         "country": None,
                         "appid": None,
-                        "error": "Failed fetching followers",
+                        "error": error,
                         "trace": traceback.format_exc(),
                     }
                 )
@@ -710,6 +927,7 @@ if run:
     run_date = datetime.now().strftime("%d-%m-%Y")
     mode_label = "New" if mode == "New releases" else "Upcoming"
     st.session_state["last_display_df"] = display_df
+    st.session_state["last_display_key"] = _df_fingerprint(display_df)
     st.session_state["last_mode_label"] = mode_label
     st.session_state["last_run_date"] = run_date
     st.session_state["last_dbg"] = dbg
@@ -727,31 +945,7 @@ if display_df is not None and mode_label is not None and run_date is not None:
     # Export (dropdown + single download button) from persisted results
     base_name = f"Steam Radar - {mode_label} {run_date}"
 
-    export_format = st.selectbox(
-        "Export format",
-        ["Export as .csv", "Export as .xlsx"],
-        index=0 if st.session_state["export_format"] == "Export as .csv" else 1,
-        key="export_format",
-    )
-
-    if export_format == "Export as .csv":
-        file_name = f"{base_name}.csv"
-        data_bytes = display_df.to_csv(index=False).encode("utf-8")
-        mime_type = "text/csv"
-    else:
-        file_name = f"{base_name}.xlsx"
-        buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-            display_df.to_excel(writer, index=False, sheet_name="Steam Radar")
-        data_bytes = buffer.getvalue()
-        mime_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-
-    st.download_button(
-        label="Download export",
-        data=data_bytes,
-        file_name=file_name,
-        mime=mime_type,
-    )
+    _export_controls(display_df, base_name)
 
     st.dataframe(
         display_df,
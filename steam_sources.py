@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-import json
 import math
 import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
 import requests
 from bs4 import BeautifulSoup
 
@@ -32,21 +36,38 @@ STORE_PAGE_URL = "https://store.steampowered.com/app/{appid}/?cc={cc}&l=english"
 # -----------------------------
 def _cache_get(storage, key: str) -> Optional[Dict[str, Any]]:
     """
-    Supports the Storage class you already have (cache_get returning CacheEntry with `.value` dict).
+    Read a cached value through Storage.get_json (SQLite-backed, TTL-aware), so results
+    survive across scans and sessions. Never raises: a cache problem just means a live fetch.
     """
     try:
-        entry = storage.cache_get(key)
-        if not entry:
+        if storage is None:
             return None
-        # Your storage.py uses CacheEntry(value: Dict[str, Any], fetched_at, ttl_seconds)
-        return entry.value
+        return storage.get_json(key)
     except Exception:
         return None
 
 
+def _cache_get_many(storage, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    try:
+        if storage is None or not keys:
+            return {}
+        return storage.get_json_many(keys)
+    except Exception:
+        return {}
+
+
 def _cache_set(storage, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
     try:
-        storage.cache_set(key, value, ttl_seconds)
+        if storage is not None:
+            storage.set_json(key, value, ttl_seconds)
+    except Exception:
+        pass
+
+
+def _cache_set_many(storage, items: List[Tuple[str, Dict[str, Any], int]]) -> None:
+    try:
+        if storage is not None and items:
+            storage.set_json_many(items)
     except Exception:
         pass
 
@@ -61,18 +82,107 @@ _SESSION.headers.update(
         "Accept-Language": "en-US,en;q=0.9",
     }
 )
+# Keep enough pooled keep-alive connections per host for the scan/enrichment thread pools,
+# so concurrent calls reuse TCP+TLS instead of reconnecting. Retries stay in _get.
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: bursts of up to `burst` calls, then `rate_per_sec` on average.
+    backoff() (on a 429) halves the rate for `backoff_seconds`; it then recovers. Calls made while
+    already slowed are ignored, so a burst of 429s from concurrent workers counts as one.
+    """
 
+    def __init__(self, rate_per_sec: float, burst: int, backoff_seconds: float = 60.0) -> None:
+        self.rate_per_sec = float(rate_per_sec)
+        self.burst = float(burst)
+        self.backoff_seconds = float(backoff_seconds)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._slowdown = 1.0
+        self._slow_until = 0.0
+        self._lock = threading.Lock()
+
+    def take(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self._slowdown > 1.0 and now >= self._slow_until:
+                    self._slowdown = 1.0
+                rate = self.rate_per_sec / self._slowdown
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / rate
+            time.sleep(wait)
+
+    def backoff(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now < self._slow_until:
+                return
+            self._slowdown = 2.0
+            self._slow_until = now + self.backoff_seconds
+
+
+# Shared by every appdetails call (all sessions), at a fixed rate: a process-wide ceiling.
+# Each fetch_appdetails_batch call additionally paces itself with its own bucket (per_request_sleep).
+_APPDETAILS_BUCKET = TokenBucket(rate_per_sec=3.0, burst=8)
+
+
+RETRY_AFTER_MAX_SECONDS = 30.0
+
+
+def _retry_after_seconds(r: requests.Response) -> Optional[float]:
+    """
+    Retry-After as seconds to wait (delta-seconds or HTTP-date form), capped at
+    RETRY_AFTER_MAX_SECONDS. None when the header is missing or unparseable.
+    """
+    ra = (r.headers.get("Retry-After") or "").strip()
+    if not ra:
+        return None
+    try:
+        seconds = float(ra)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(ra)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    if math.isnan(seconds):
+        return None
+    return min(max(0.0, seconds), RETRY_AFTER_MAX_SECONDS)
 
-def _get(url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 20, max_retries: int = 6) -> requests.Response:
+
+def _get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: int = 20,
+    max_retries: int = 6,
+    bucket: Optional[TokenBucket] = None,
+) -> requests.Response:
     """
-    GET with exponential backoff for 429/5xx.
+    GET with exponential backoff for 429/5xx. `bucket`, if given, is taken before every
+    attempt (retries included) and slowed down by a 429.
     """
     for attempt in range(max_retries):
+        if bucket is not None:
+            bucket.take()
         r = _SESSION.get(url, params=params, timeout=timeout)
 
+        if r.status_code == 429 and bucket is not None:
+            bucket.backoff()
         if r.status_code in (429, 500, 502, 503, 504):
-            # exponential backoff + jitter
-            sleep_s = min(8.0, (0.75 * (2 ** attempt))) + random.random() * 0.25
+            # server-provided Retry-After if any, else exponential backoff + jitter
+            sleep_s = _retry_after_seconds(r)
+            if sleep_s is None:
+                sleep_s = min(8.0, (0.75 * (2 ** attempt))) + random.random() * 0.25
             time.sleep(sleep_s)
             continue
 
@@ -82,9 +192,41 @@ def _get(url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 20, m
     return r
 
 
+def _json(r: requests.Response) -> Any:
+    """Decode a JSON response body with orjson (much faster than r.json() on appdetails payloads)."""
+    return orjson.loads(r.content)
+
+
 # -----------------------------
 # Global tags (Steam browse page)
 # -----------------------------
+# Fallback list: common Steam tags (ordered roughly by prevalence), used when Steam and the cache both fail
+FALLBACK_US_TAGS = [
+    "Action", "Adventure", "RPG", "Strategy", "Simulation", "Indie", "Casual",
+    "Singleplayer", "Multiplayer", "Co-op", "Online Co-Op",
+    "Open World", "Story Rich", "First-Person", "Third Person",
+    "Shooter", "FPS", "Tactical", "Stealth",
+    "Survival", "Crafting", "Sandbox", "Building",
+    "Horror", "Psychological Horror",
+    "Puzzle", "Platformer", "Metroidvania",
+    "Roguelike", "Roguelite",
+    "Turn-Based", "Turn-Based Strategy", "Real-Time Strategy",
+    "Card Game", "Deckbuilding",
+    "Sports", "Racing",
+    "JRPG", "ARPG",
+    "Visual Novel", "Dating Sim",
+    "Souls-like",
+    "Hack and Slash",
+    "City Builder", "Management",
+    "Tower Defense",
+    "Fighting",
+    "Massively Multiplayer", "MMORPG",
+    "Anime", "Pixel Graphics", "2D", "3D",
+    "VR", "Controller",
+    "Early Access", "Free to Play",
+]
+
+
 def fetch_global_tags(storage, cc: str) -> List[Dict[str, Any]]:
     """
     Returns Steam Global Tags list as: [{"name": "...", "id": None}, ...]
@@ -95,32 +237,6 @@ def fetch_global_tags(storage, cc: str) -> List[Dict[str, Any]]:
     cc = (cc or "US").upper()
     cache_key = f"steam_global_tags:{cc}"
 
-    # --- Fallback list: common Steam tags (ordered roughly by prevalence) ---
-    FALLBACK_US_TAGS = [
-        "Action", "Adventure", "RPG", "Strategy", "Simulation", "Indie", "Casual",
-        "Singleplayer", "Multiplayer", "Co-op", "Online Co-Op",
-        "Open World", "Story Rich", "First-Person", "Third Person",
-        "Shooter", "FPS", "Tactical", "Stealth",
-        "Survival", "Crafting", "Sandbox", "Building",
-        "Horror", "Psychological Horror",
-        "Puzzle", "Platformer", "Metroidvania",
-        "Roguelike", "Roguelite",
-        "Turn-Based", "Turn-Based Strategy", "Real-Time Strategy",
-        "Card Game", "Deckbuilding",
-        "Sports", "Racing",
-        "JRPG", "ARPG",
-        "Visual Novel", "Dating Sim",
-        "Souls-like",
-        "Hack and Slash",
-        "City Builder", "Management",
-        "Tower Defense",
-        "Fighting",
-        "Massively Multiplayer", "MMORPG",
-        "Anime", "Pixel Graphics", "2D", "3D",
-        "VR", "Controller",
-        "Early Access", "Free to Play",
-    ]
-
     def _normalize_tags(tag_names: List[str]) -> List[Dict[str, Any]]:
         seen = set()
         out: List[Dict[str, Any]] = []
@@ -148,8 +264,9 @@ def fetch_global_tags(storage, cc: str) -> List[Dict[str, Any]]:
 
     # 2) Try live fetch
     try:
-        html = _http_get_text(STEAM_TAG_BROWSE_URL, params={"cc": cc})
-        soup = BeautifulSoup(html, "html.parser")
+        r = _get(GLOBAL_TAGS_URL.format(cc=cc))
+        r.raise_for_status()
+        soup = BeautifulSoup(r.text, "lxml")
 
         tag_names: List[str] = []
         for a in soup.select("a.tag_browse_tag"):
@@ -189,11 +306,26 @@ def fetch_global_tags(storage, cc: str) -> List[Dict[str, Any]]:
 # -----------------------------
 # Steam search: fetch appids
 # -----------------------------
+# results_html is machine-generated: find each <a ...> open tag (quoted values may hold '>')
+# and read its attributes, instead of building a parse tree for one attribute per row.
+_OPEN_A_TAG_RE = re.compile(r"""<a\s(?:[^>"']|"[^"]*"|'[^']*')*>""", re.IGNORECASE)
+_TAG_ATTR_RE = re.compile(r"""([^\s=/>"']+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))""")
+
+
 def _parse_search_appids(html: str) -> List[int]:
-    soup = BeautifulSoup(html, "html.parser")
     appids: List[int] = []
-    for a in soup.select("a.search_result_row"):
-        appid = a.get("data-ds-appid") or a.get("data-ds-packageid")
+    for tag in _OPEN_A_TAG_RE.finditer(html):
+        tag_text = tag.group(0)
+        if "search_result_row" not in tag_text:
+            continue
+        attrs: Dict[str, str] = {}
+        for m in _TAG_ATTR_RE.finditer(tag_text, 2):
+            name = m.group(1).lower()
+            if name not in attrs:
+                attrs[name] = m.group(2) if m.group(2) is not None else (m.group(3) if m.group(3) is not None else m.group(4))
+        if "search_result_row" not in attrs.get("class", "").split():
+            continue
+        appid = attrs.get("data-ds-appid") or attrs.get("data-ds-packageid")
         if not appid:
             continue
         # data-ds-appid can be "123,456" sometimes
@@ -203,6 +335,52 @@ def _parse_search_appids(html: str) -> List[int]:
     return appids
 
 
+# Search pages are independent (addressed by "start"), so they are requested concurrently.
+# The semaphore is process-wide: callers run per country on their own pools, and this bounds
+# the search requests in flight across all of them, not per call.
+SEARCH_PAGE_WORKERS = 4
+_SEARCH_SEMAPHORE = threading.BoundedSemaphore(SEARCH_PAGE_WORKERS)
+
+
+def _fetch_search_page(storage, params: Dict[str, Any]) -> List[int]:
+    # The params fully determine the page; cache its parsed appids briefly so reruns skip the network
+    key = "search::" + "::".join(f"{k}={params[k]}" for k in sorted(params))
+    cached = _cache_get(storage, key)
+    if cached and "appids" in cached:
+        return [int(a) for a in cached["appids"]]
+
+    with _SEARCH_SEMAPHORE:
+        r = _get(STEAM_SEARCH_URL, params=params)
+    r.raise_for_status()
+
+    # Search results endpoint returns JSON with "results_html"
+    payload = _json(r)
+    html = payload.get("results_html", "")
+    appids = _parse_search_appids(html)
+    _cache_set(storage, key, {"appids": appids}, ttl_seconds=60 * 10)
+    return appids
+
+
+def _fetch_search_pages(storage, page_params: List[Dict[str, Any]]) -> List[int]:
+    """
+    Fetch every search page on a small pool (live requests are further capped process-wide by
+    _SEARCH_SEMAPHORE); appids keep page order, unique, order preserved.
+    """
+    if not page_params:
+        return []
+    with ThreadPoolExecutor(max_workers=min(SEARCH_PAGE_WORKERS, len(page_params))) as ex:
+        pages = list(ex.map(lambda params: _fetch_search_page(storage, params), page_params))
+
+    seen = set()
+    out: List[int] = []
+    for page_appids in pages:
+        for a in page_appids:
+            if a not in seen:
+                seen.add(a)
+                out.append(a)
+    return out
+
+
 def fetch_appids(
     storage,
     country: str,
@@ -217,36 +395,22 @@ def fetch_appids(
     country = (country or "US").upper()
     include_tagids = include_tagids or []
 
-    appids: List[int] = []
-    for p in range(pages):
-        start = p * per_page
-        params = {
-            "cc": country,
-            "l": "english",
-            "start": start,
-            "count": per_page,
-            "sort_by": sort_by,
-            "infinite": 1,
-            "category1": 998,  # Games
-        }
-        # Tags can be applied via "tags" param in some search flows, but we keep tags local for speed.
-        r = _get(STEAM_SEARCH_URL, params=params)
-        r.raise_for_status()
-
-        # Search results endpoint returns JSON with "results_html"
-        payload = r.json()
-        html = payload.get("results_html", "")
-        page_appids = _parse_search_appids(html)
-        appids.extend(page_appids)
-
-    # Unique preserve order
-    seen = set()
-    out: List[int] = []
-    for a in appids:
-        if a not in seen:
-            seen.add(a)
-            out.append(a)
-    return out
+    # Tags can be applied via "tags" param in some search flows, but we keep tags local for speed.
+    return _fetch_search_pages(
+        storage,
+        [
+            {
+                "cc": country,
+                "l": "english",
+                "start": p * per_page,
+                "count": per_page,
+                "sort_by": sort_by,
+                "infinite": 1,
+                "category1": 998,  # Games
+            }
+            for p in range(pages)
+        ]
+    )
 
 
 def fetch_upcoming_appids(
@@ -261,33 +425,22 @@ def fetch_upcoming_appids(
     """
     country = (country or "US").upper()
 
-    appids: List[int] = []
-    for p in range(pages):
-        start = p * per_page
-        params = {
-            "cc": country,
-            "l": "english",
-            "start": start,
-            "count": per_page,
-            "infinite": 1,
-            "category1": 998,  # Games
-            "os": "win",
-            "filter": "comingsoon",  # key difference vs new releases
-        }
-        r = _get(STEAM_SEARCH_URL, params=params)
-        r.raise_for_status()
-        payload = r.json()
-        html = payload.get("results_html", "")
-        page_appids = _parse_search_appids(html)
-        appids.extend(page_appids)
-
-    seen = set()
-    out: List[int] = []
-    for a in appids:
-        if a not in seen:
-            seen.add(a)
-            out.append(a)
-    return out
+    return _fetch_search_pages(
+        storage,
+        [
+            {
+                "cc": country,
+                "l": "english",
+                "start": p * per_page,
+                "count": per_page,
+                "infinite": 1,
+                "category1": 998,  # Games
+                "os": "win",
+                "filter": "comingsoon",  # key difference vs new releases
+            }
+            for p in range(pages)
+        ]
+    )
 
 
 # -----------------------------
@@ -300,19 +453,34 @@ def fetch_appdetails(storage, appid: int, cc: str) -> Optional[Dict[str, Any]]:
     if cached:
         return cached.get("data")
 
+    data, ttl_seconds = _request_appdetails(appid, cc)
+    _cache_set(storage, key, {"data": data}, ttl_seconds=ttl_seconds)
+    return data
+
+
+def _request_appdetails(
+    appid: int, cc: str, pace: Optional[TokenBucket] = None
+) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    Live appdetails call. Returns (data, cache ttl): failures are cached briefly, hits for a day.
+    `pace` is the caller's own bucket, taken before the shared _APPDETAILS_BUCKET (which _get
+    takes on every attempt).
+    """
     params = {"appids": int(appid), "cc": cc, "l": "english"}
-    r = _get(APPDETAILS_URL, params=params)
+    if pace is not None:
+        pace.take()
+    r = _get(APPDETAILS_URL, params=params, bucket=_APPDETAILS_BUCKET)
     r.raise_for_status()
-    payload = r.json()
+    payload = _json(r)
 
     block = payload.get(str(appid), {})
     if not block or not block.get("success"):
-        _cache_set(storage, key, {"data": None}, ttl_seconds=60 * 30)
-        return None
+        return None, 60 * 30
+    return block.get("data"), 60 * 60 * 24
 
-    data = block.get("data")
-    _cache_set(storage, key, {"data": data}, ttl_seconds=60 * 60 * 24)
-    return data
+
+# Concurrent appdetails requests in flight; pacing comes from the token buckets.
+APPDETAILS_MAX_WORKERS = 8
 
 
 def fetch_appdetails_batch(
@@ -321,19 +489,65 @@ def fetch_appdetails_batch(
     cc: str,
     batch_size: int = 25,
     per_request_sleep: float = 0.45,
+    max_workers: int = APPDETAILS_MAX_WORKERS,
+    on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> Dict[int, Optional[Dict[str, Any]]]:
     """
-    Steam appdetails endpoint is 1 appid per call. This helper batches sequentially
-    and respects a configurable delay to avoid 429.
+    Steam appdetails endpoint is 1 appid per call. Cache hits are answered up front;
+    only the misses are fetched, on a bounded thread pool. Requests are paced by this call's own
+    token bucket, averaging one per `per_request_sleep` seconds after a short burst, and never
+    exceed the process-wide _APPDETAILS_BUCKET, to avoid 429.
+    `on_progress(done, total)` is called on the calling thread as results come in.
     """
-    out: Dict[int, Optional[Dict[str, Any]]] = {}
     cc = (cc or "US").upper()
-
-    for i, appid in enumerate(appids):
-        out[int(appid)] = fetch_appdetails(storage, int(appid), cc)
-        if per_request_sleep > 0:
-            time.sleep(per_request_sleep)
-    return out
+    # Per call, so one session's delay setting never changes another session's pace
+    pace = TokenBucket(rate_per_sec=1.0 / per_request_sleep, burst=8) if per_request_sleep > 0 else None
+    found: Dict[int, Optional[Dict[str, Any]]] = {}
+    misses: List[int] = []
+
+    # One batched cache read for the whole list; only the misses go to the network
+    # (cc is normalized once above; each key is formatted once and reused for the write-back)
+    keys = {a: f"appdetails::{a}::{cc}" for a in map(int, appids)}
+    cached_map = _cache_get_many(storage, list(keys.values()))
+    for appid, key in keys.items():
+        cached = cached_map.get(key)
+        if cached:
+            found[appid] = cached.get("data")
+        else:
+            misses.append(appid)
+
+    def _fetch_one(appid: int) -> Tuple[Optional[Dict[str, Any]], Optional[int], Optional[Exception]]:
+        # A failed request only loses its own app: (None, None, error), and nothing is cached for it
+        try:
+            data, ttl_seconds = _request_appdetails(appid, cc, pace)
+        except Exception as exc:
+            return None, None, exc
+        return data, ttl_seconds, None
+
+    # Fresh results are written back in one transaction once the pool is done
+    # (also when the caller's progress callback fails part-way, so completed fetches are not lost).
+    to_cache: List[Tuple[str, Dict[str, Any], int]] = []
+    errors: List[Exception] = []
+    if on_progress is not None:
+        on_progress(len(found), len(keys))
+    try:
+        if misses:
+            with ThreadPoolExecutor(max_workers=max(1, min(int(max_workers), len(misses)))) as ex:
+                for appid, (data, ttl_seconds, exc) in zip(misses, ex.map(_fetch_one, misses)):
+                    found[appid] = data
+                    if exc is not None:
+                        errors.append(exc)
+                    else:
+                        to_cache.append((keys[appid], {"data": data}, ttl_seconds))
+                    if on_progress is not None:
+                        on_progress(len(found), len(keys))
+    finally:
+        _cache_set_many(storage, to_cache)
+
+    # Partial failures come back as None (missing details); only a batch where every request failed raises
+    if errors and len(errors) == len(misses):
+        raise errors[0]
+    return {appid: found[appid] for appid in keys}
 
 
 # -----------------------------
@@ -360,7 +574,7 @@ def fetch_reviews(storage, appid: int, cc: str, lookback_days: int) -> Dict[str,
     }
     r = _get(REVIEWS_URL.format(appid=int(appid)), params=params)
     r.raise_for_status()
-    payload = r.json()
+    payload = _json(r)
 
     q = payload.get("query_summary", {}) or {}
     total = int(q.get("total_reviews", 0) or 0)
@@ -387,15 +601,33 @@ def release_date_text(data: Dict[str, Any]) -> str:
     return ""
 
 
-def parse_release(data: Dict[str, Any]) -> Optional[datetime]:
-    """
-    Best-effort parsing of appdetails release_date.
-    Returns aware datetime in UTC (midnight).
-    """
-    rd = (data or {}).get("release_date") or {}
-    date_str = (rd.get("date") or "").strip()
-    if not date_str:
-        return None
+_MONTHS = ("january", "february", "march", "april", "may", "june", "july",
+           "august", "september", "october", "november", "december")
+MONTH_MAP = {**{m: i for i, m in enumerate(_MONTHS, 1)}, **{m[:3]: i for i, m in enumerate(_MONTHS, 1)}}
+
+# The common appdetails shapes ("27 Dec, 2025", "Dec 27, 2025", "2025-12-27") in one match;
+# anything else goes through the strptime loop below.
+_RELEASE_RE = re.compile(
+    r"(?:(\d{1,2})\s+([a-z]+),\s+(\d{4})|([a-z]+)\s+(\d{1,2}),\s+(\d{4})|(\d{4})-(\d{2})-(\d{2}))",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_release_text(date_str: str) -> Optional[datetime]:
+    m = _RELEASE_RE.fullmatch(date_str)
+    if m:
+        d1, mon1, y1, mon2, d2, y2, y3, m3, d3 = m.groups()
+        if y3:
+            year, month, day = int(y3), int(m3), int(d3)
+        else:
+            month = MONTH_MAP.get((mon1 or mon2).lower())
+            year, day = int(y1 or y2), int(d1 or d2)
+        if month:
+            try:
+                return datetime(year, month, day, tzinfo=timezone.utc)
+            except ValueError:
+                return None
 
     # Steam can return formats like "27 Dec, 2025" or "Dec 27, 2025" etc.
     patterns = [
@@ -412,13 +644,31 @@ def parse_release(data: Dict[str, Any]) -> Optional[datetime]:
         except Exception:
             pass
 
-    # If Steam gives only a year or quarter, treat as unknown (None)
-    if re.fullmatch(r"\d{4}", date_str):
-        return None
-    if re.match(r"q[1-4]\s*\d{4}", date_str, re.IGNORECASE):
+    # If Steam gives only a year or quarter ("2026", "Q3 2026", "Coming soon"), treat as unknown (None)
+    return None
+
+
+def parse_release(data: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Best-effort parsing of appdetails release_date.
+    Returns aware datetime in UTC (midnight).
+    """
+    rd = (data or {}).get("release_date") or {}
+    date_str = (rd.get("date") or "").strip()
+    if not date_str:
         return None
+    return _parse_release_text(date_str)
 
-    return None
+
+def release_timestamp(data: Dict[str, Any]) -> Optional[float]:
+    """
+    parse_release as POSIX seconds (UTC midnight), or None.
+    Lets callers do age/window checks as plain float arithmetic against one `now` timestamp.
+    """
+    dt = parse_release(data)
+    if dt is None:
+        return None
+    return dt.timestamp()
 
 
 def is_coming_soon(data: Dict[str, Any]) -> bool:
@@ -516,7 +766,7 @@ def fetch_wishlist_estimate_gamedata(storage, appid: int) -> Optional[int]:
         if r.status_code != 200:
             _cache_set(storage, key, {"wishlists": None}, ttl_seconds=60 * 60)
             return None
-        payload = r.json()
+        payload = _json(r)
         wl = payload.get("wishlists") or payload.get("wishlist") or payload.get("wl")
         if wl is None:
             _cache_set(storage, key, {"wishlists": None}, ttl_seconds=60 * 60)
@@ -546,7 +796,10 @@ def fetch_followers(storage, appid: int) -> Optional[int]:
         if r.status_code != 200:
             _cache_set(storage, key, {"followers": None}, ttl_seconds=60 * 60)
             return None
-        m = _FOLLOWERS_RE.search(r.text)
+        text = r.text
+        # Most store pages carry no follower count: skip the regex scan unless the word is there.
+        # casefold() keeps the pre-check as case-insensitive as the regex (any mix of cases).
+        m = _FOLLOWERS_RE.search(text) if "followers" in text.casefold() else None
         if not m:
             _cache_set(storage, key, {"followers": None}, ttl_seconds=60 * 60)
             return None
@@ -1,117 +1,676 @@
 from __future__ import annotations
 
-import json
+import atexit
+import hashlib
+import os
+import queue
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
 
+import orjson
+import zstandard
 
-DB_SCHEMA = """
-PRAGMA journal_mode=WAL;
-
-CREATE TABLE IF NOT EXISTS cache (
-  key TEXT PRIMARY KEY,
-  value_json TEXT NOT NULL,
-  fetched_at INTEGER NOT NULL,
-  ttl_seconds INTEGER NOT NULL
-);
 
+# journal_mode=WAL is persistent in the database file; it is set with the connection PRAGMAs.
+# *_json columns hold orjson bytes (BLOB); databases created earlier declare them TEXT, which
+# SQLite does not coerce for bytes, and older str values still decode with orjson.loads.
+DB_SCHEMA = """
 CREATE TABLE IF NOT EXISTS snapshots (
   snapshot_id INTEGER PRIMARY KEY AUTOINCREMENT,
   created_at INTEGER NOT NULL,
   snapshot_type TEXT NOT NULL,
   country TEXT NOT NULL,
-  params_json TEXT NOT NULL,
-  rows_json TEXT NOT NULL
+  params_json BLOB NOT NULL,
+  rows_json BLOB NOT NULL
 );
+
+-- Latest snapshot per type/country without scanning the table
+CREATE INDEX IF NOT EXISTS idx_snapshots_type_country_created
+  ON snapshots(snapshot_type, country, created_at DESC);
+
+-- Snapshot rows in chunks of up to SNAPSHOT_ROWS_PER_BLOB, each a zstd-compressed JSON array
+-- (encoded like cache values; idx is the chunk number). snapshots.rows_json stays an empty list for these.
+CREATE TABLE IF NOT EXISTS snapshot_rows (
+  snapshot_id INTEGER NOT NULL,
+  idx INTEGER NOT NULL,
+  row_blob BLOB NOT NULL,
+  PRIMARY KEY (snapshot_id, idx)
+);
+"""
+
+
+# The cache lives in its own file, ATTACHed to every connection as `cache_db`: it is recomputable,
+# so it runs with synchronous=OFF (no fsync at all) while snapshots in the main file stay durable.
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_db.cache (
+  key_hash INTEGER PRIMARY KEY,
+  key TEXT NOT NULL,
+  value_json BLOB NOT NULL,
+  fetched_at INTEGER NOT NULL,
+  ttl_seconds INTEGER NOT NULL
+);
+"""
+
+CACHE_DB_PRAGMAS = """
+PRAGMA cache_db.journal_mode=WAL;
+PRAGMA cache_db.synchronous=OFF;
+"""
+
+
+# Applied once per connection (connections are long-lived, see Storage._get_conn):
+# no fsync per commit under WAL, 64 MiB page cache, 256 MiB mmap, checkpoint every ~1000 pages
+CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+PRAGMA wal_autocheckpoint=1000;
+"""
+
+
+CACHE_UPSERT_SQL = """
+INSERT INTO cache_db.cache(key_hash, key, value_json, fetched_at, ttl_seconds)
+VALUES(?, ?, ?, ?, ?)
+ON CONFLICT(key_hash) DO UPDATE SET
+  key=excluded.key,
+  value_json=excluded.value_json,
+  fetched_at=excluded.fetched_at,
+  ttl_seconds=excluded.ttl_seconds
 """
 
+CACHE_GET_SQL = (
+    "SELECT value_json, fetched_at, ttl_seconds FROM cache_db.cache"
+    " WHERE key_hash=? AND key=? AND fetched_at + ttl_seconds >= ?"
+)
+# The key hashes are bound as one JSON array and expanded by json_each inside SQLite:
+# one fixed statement and one parameter however many keys there are (no 999-variable cap)
+CACHE_GET_MANY_SQL = (
+    "SELECT key_hash, key, value_json, fetched_at, ttl_seconds FROM cache_db.cache"
+    " WHERE key_hash IN (SELECT value FROM json_each(?)) AND fetched_at + ttl_seconds >= ?"
+)
+CACHE_SWEEP_SQL = "DELETE FROM cache_db.cache WHERE fetched_at + ttl_seconds < ?"
+
+SNAPSHOT_INSERT_SQL = """
+INSERT INTO snapshots(created_at, snapshot_type, country, params_json, rows_json)
+VALUES(?, ?, ?, ?, ?)
+"""
+SNAPSHOT_ROW_INSERT_SQL = "INSERT INTO snapshot_rows(snapshot_id, idx, row_blob) VALUES(?, ?, ?)"
+SNAPSHOT_HEAD_SQL = "SELECT rows_json FROM snapshots WHERE snapshot_id=?"
+SNAPSHOT_ROWS_SQL = "SELECT row_blob FROM snapshot_rows WHERE snapshot_id=? ORDER BY idx"
+
+# Per-connection prepared-statement cache size (sqlite3 default is 128)
+CACHED_STATEMENTS = 256
+
+
+def _key_hash(key: str) -> int:
+    """
+    Signed 64-bit hash of a cache key: the cache table is keyed by it (INTEGER PRIMARY KEY,
+    i.e. the rowid b-tree) instead of by the text key. Lookups also compare `key` to rule out collisions.
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little", signed=True)
+
+
+# Stored cache values start with a one-byte tag. Payloads above the threshold (mostly
+# appdetails) are zstd-compressed; rows from before the tag start with JSON text instead.
+_RAW_TAG = b"\x00"
+_ZSTD_TAG = b"\x01"
+COMPRESS_MIN_BYTES = 2048
+# Snapshot rows are small on their own; grouping them gives zstd enough data to compress well
+SNAPSHOT_ROWS_PER_BLOB = 256
+_zstd_local = threading.local()
+
+
+def _zstd() -> Tuple[zstandard.ZstdCompressor, zstandard.ZstdDecompressor]:
+    # zstandard contexts must not be shared between threads
+    pair = getattr(_zstd_local, "pair", None)
+    if pair is None:
+        pair = (zstandard.ZstdCompressor(level=3), zstandard.ZstdDecompressor())
+        _zstd_local.pair = pair
+    return pair
+
+
+def _encode_value(value: Any, option: int = orjson.OPT_NON_STR_KEYS) -> bytes:
+    payload = orjson.dumps(value, option=option)
+    if len(payload) > COMPRESS_MIN_BYTES:
+        return _ZSTD_TAG + _zstd()[0].compress(payload)
+    return _RAW_TAG + payload
+
+
+def _encode_cache_value(value: Any) -> Tuple[bytes, Any]:
+    """
+    (blob, value for the memory layer). Non-str keys are stored as strings, so for those values
+    the memory layer gets the round-tripped form: a hit must read back the same as a SQLite read.
+    """
+    try:
+        return _encode_value(value, 0), value
+    except orjson.JSONEncodeError:
+        blob = _encode_value(value)
+        return blob, _decode_value(blob)
+
+
+def _decode_value(raw: Any) -> Any:
+    if isinstance(raw, bytes):
+        tag = raw[:1]
+        if tag == _ZSTD_TAG:
+            return orjson.loads(_zstd()[1].decompress(memoryview(raw)[1:]))
+        if tag == _RAW_TAG:
+            return orjson.loads(memoryview(raw)[1:])
+    return orjson.loads(raw)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list]:
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU with per-entry expiry, used as an in-process layer in front of
+    the SQLite cache. Values are shared, not copied: callers must treat them as read-only.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        # key -> (expires_at, fetched_at, value)
+        self._data: "OrderedDict[Any, Tuple[float, int, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, now: Optional[float] = None) -> Optional[Any]:
+        """`now` lets batch callers read the clock once for many lookups."""
+        if now is None:
+            now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            if now >= item[0]:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return item[2]
+
+    def put(self, key: Any, value: Any, expires_at: float, fetched_at: int) -> None:
+        """
+        Insert or replace, unless the entry already held is newer (later fetched_at): a reader that
+        loaded an old row from SQLite must not clobber a value a concurrent writer just stored.
+        """
+        with self._lock:
+            current = self._data.get(key)
+            if current is not None and current[1] > fetched_at:
+                return
+            self._data[key] = (expires_at, fetched_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 
-@dataclass(frozen=True)
-class CacheEntry:
-    value: Dict[str, Any]
-    fetched_at: int
-    ttl_seconds: int
+# Expired rows are skipped on read and deleted in bulk at most this often
+SWEEP_INTERVAL_SECONDS = 60 * 60
+# Last sweep per cache file, process-wide: a Storage is created per Streamlit session
+_LAST_SWEEP: Dict[str, int] = {}
+_LAST_SWEEP_LOCK = threading.Lock()
+
+# Entries per transaction in set_json_many (bounds memory for very large batches)
+SET_MANY_CHUNK = 10_000
+
+# Background snapshot writer: most items per transaction, and how long to wait for more
+WRITER_BATCH_MAX = 500
+WRITER_BATCH_WAIT_SECONDS = 0.05
+
+# Process-wide, so Streamlit reruns and every session's Storage share hot entries.
+# Keyed by (cache_db_path, key) to keep separate databases apart.
+_MEMORY_CACHE = TTLCache(maxsize=4096)
+
+
+def _settle(fut: "Future[int]", result: Optional[int] = None, exc: Optional[BaseException] = None) -> None:
+    """Resolve a writer Future; a Future the caller already resolved must not kill the writer thread."""
+    try:
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+class _SnapshotWriter:
+    """
+    One background thread for the whole process, shared by every Storage (one per Streamlit
+    session), so sessions do not each leave a blocked thread behind. Queue items are
+    (storage, future, args); a queued item is the only reference the writer keeps to a Storage,
+    so a dropped Storage is freed once its snapshots are written. Started on first use, and
+    drained at interpreter exit through atexit (the thread itself is a daemon).
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    def submit(self, item: Tuple[Any, Optional["Future[int]"], Any]) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="storage-writer", daemon=True)
+                self._thread.start()
+                if not self._atexit_registered:
+                    atexit.register(self.shutdown)
+                    self._atexit_registered = True
+            self._queue.put(item)
+
+    def join(self) -> None:
+        """Block until every item queued so far has been handled."""
+        self._queue.join()
+
+    def shutdown(self) -> None:
+        """Write out everything still queued and stop the thread (the next submit starts a new one)."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+
+    def _loop(self) -> None:
+        """
+        Take up to WRITER_BATCH_MAX items, waiting at most WRITER_BATCH_WAIT_SECONDS for more after
+        the first, and hand each Storage its share of the batch (one transaction per Storage).
+        """
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                self._queue.task_done()
+                break
+            taken = [first]
+            deadline = time.monotonic() + WRITER_BATCH_WAIT_SECONDS
+            while len(taken) < WRITER_BATCH_MAX:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                taken.append(item)
+
+            try:
+                self._write(taken)
+            finally:
+                for _ in range(len(taken)):
+                    self._queue.task_done()
+                # keep no Storage alive while blocked on the next get()
+                taken = first = item = None
+
+    @staticmethod
+    def _write(taken: list) -> None:
+        by_storage: Dict[Any, list] = {}
+        for storage, fut, args in taken:
+            by_storage.setdefault(storage, []).append((fut, args))
+        for storage, items in by_storage.items():
+            try:
+                storage._write_batch(items)
+            except Exception as exc:
+                for fut, _ in items:
+                    if fut is not None:
+                        _settle(fut, exc=exc)
+
+
+_SNAPSHOT_WRITER = _SnapshotWriter()
 
 
 class Storage:
-    def __init__(self, db_path: str = "steam_radar.sqlite") -> None:
+    def __init__(self, db_path: str = "steam_radar.sqlite", cache_db_path: Optional[str] = None) -> None:
+        # Every thread opens its own connection, and each ":memory:" connection is a separate empty database
+        if ":memory:" in (db_path, cache_db_path):
+            raise ValueError("Storage needs file-backed databases; ':memory:' is not supported")
         self.db_path = db_path
+        # default: steam_radar.sqlite -> steam_radar_cache.sqlite next to it
+        if cache_db_path is None:
+            root, ext = os.path.splitext(db_path)
+            cache_db_path = f"{root}_cache{ext}"
+        self.cache_db_path = cache_db_path
+        self._local = threading.local()
+        # SQLite allows a single writer at a time; serialize our own writes across threads
+        self._write_lock = threading.Lock()
+        # > 0 while a bulk() block is active (guarded by _write_lock)
+        self._bulk_depth = 0
+        # save_snapshot hands work to a single writer thread, started on first use
+        self._uses_writer = False
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        con = sqlite3.connect(self.db_path, check_same_thread=False)
-        con.row_factory = sqlite3.Row
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        One connection per thread, opened on first use and then reused for every call.
+        Autocommit mode (isolation_level=None): single statements commit on their own.
+        Default row factory: rows are plain tuples, unpacked positionally.
+        """
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None, cached_statements=CACHED_STATEMENTS
+            )
+            con.executescript(CONNECTION_PRAGMAS)
+            con.execute("ATTACH DATABASE ? AS cache_db", (self.cache_db_path,))
+            con.executescript(CACHE_DB_PRAGMAS)
+            self._local.con = con
+            # Reused for the single-row cache get/set, instead of a new cursor per con.execute
+            self._local.cur = con.cursor()
         return con
 
-    def _init_db(self) -> None:
-        con = self._connect()
+    def _get_cursor(self) -> sqlite3.Cursor:
+        """This thread's long-lived cursor (see _get_conn); each execute() resets it."""
+        self._get_conn()
+        return self._local.cur
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Explicit transaction for multi-statement writes (everything else autocommits).
+        BEGIN IMMEDIATE takes SQLite's write lock up front, so another process cannot make
+        the batch fail half-way with SQLITE_BUSY when it upgrades from read to write.
+        """
+        with self._write_lock:
+            con = self._get_conn()
+            # inside bulk(), on whichever thread's connection is doing the write
+            bulk = self._bulk_depth > 0
+            if bulk:
+                con.execute("PRAGMA synchronous=OFF")
+            try:
+                con.execute("BEGIN IMMEDIATE")
+                try:
+                    yield con
+                except BaseException:
+                    con.execute("ROLLBACK")
+                    raise
+                con.execute("COMMIT")
+            finally:
+                if bulk:
+                    con.execute("PRAGMA synchronous=NORMAL")
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Run large imports with synchronous=OFF (no syncs at all): while the block is active, every
+        batched write (set_json_many, save_snapshots, and the snapshot writer thread) commits without
+        syncing, and snapshots queued inside the block are flushed before it exits. Faster, but a
+        power loss mid-import can lose or damage recent writes, so use it only for data that can be
+        rebuilt. The cache database always runs with synchronous=OFF.
+        """
+        with self._write_lock:
+            self._bulk_depth += 1
         try:
+            yield
+            self.flush()
+        finally:
+            with self._write_lock:
+                self._bulk_depth -= 1
+
+    def _init_db(self) -> None:
+        with self._write_lock:
+            con = self._get_conn()
+            # Databases from before the separate cache file kept `cache` in main; it is recomputable, so drop it
+            con.execute("DROP TABLE IF EXISTS main.cache")
             con.executescript(DB_SCHEMA)
-            con.commit()
+            con.executescript(CACHE_SCHEMA)
+
+    def purge_expired(self) -> int:
+        """Delete expired cache rows. Returns how many were removed."""
+        with self._write_lock:
+            return self._get_conn().execute(CACHE_SWEEP_SQL, (int(time.time()),)).rowcount
+
+    def _maybe_sweep(self, now: int) -> None:
+        """
+        Kick off purge_expired at most once per SWEEP_INTERVAL_SECONDS, on a short-lived
+        background thread, so the read that notices it is due does not wait for the DELETE.
+        """
+        with _LAST_SWEEP_LOCK:
+            if now - _LAST_SWEEP.get(self.cache_db_path, 0) < SWEEP_INTERVAL_SECONDS:
+                return
+            _LAST_SWEEP[self.cache_db_path] = now
+        threading.Thread(target=self._sweep, name="storage-sweep", daemon=True).start()
+
+    def _sweep(self) -> None:
+        # Best-effort: expired rows are already invisible to reads, so a failed sweep just waits for the next one
+        try:
+            self.purge_expired()
+        except Exception:
+            pass
         finally:
-            con.close()
+            self._close_conn()
 
     # ---------- JSON cache helpers ----------
     def get_json(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get cached JSON value if present and not expired."""
-        con = self._connect()
-        try:
-            row = con.execute(
-                "SELECT value_json, fetched_at, ttl_seconds FROM cache WHERE key=?",
-                (key,),
-            ).fetchone()
-            if not row:
-                return None
+        """Get cached JSON value if present and not expired (memory first, then SQLite)."""
+        # One clock read serves the memory layer, the SQL TTL filter and the sweep check
+        now = int(time.time())
+        mem_key = (self.cache_db_path, key)
+        value = _MEMORY_CACHE.get(mem_key, now)
+        if value is not None:
+            return value
 
-            fetched_at = int(row["fetched_at"])
-            ttl_seconds = int(row["ttl_seconds"])
-            now = int(time.time())
-            if now - fetched_at > ttl_seconds:
-                con.execute("DELETE FROM cache WHERE key=?", (key,))
-                con.commit()
-                return None
+        self._maybe_sweep(now)
+        # Expired rows are filtered in SQL, so they are never decoded
+        row = self._get_cursor().execute(
+            CACHE_GET_SQL,
+            (_key_hash(key), key, now),
+        ).fetchone()
+        if not row:
+            return None
 
-            return json.loads(row["value_json"])
-        finally:
-            con.close()
+        value_json, fetched_at, ttl_seconds = row
+        value = _decode_value(value_json)
+        _MEMORY_CACHE.put(mem_key, value, fetched_at + ttl_seconds + 1, fetched_at)
+        return value
+
+    def get_json_with_meta(self, key: str) -> Optional[Tuple[Dict[str, Any], int, int]]:
+        """
+        (value, fetched_at, ttl_seconds) for a live entry, else None. Plain tuple, read straight
+        from SQLite (the memory layer does not keep ttl_seconds); for the rare callers that need age.
+        """
+        row = self._get_cursor().execute(CACHE_GET_SQL, (_key_hash(key), key, int(time.time()))).fetchone()
+        if not row:
+            return None
+        value_json, fetched_at, ttl_seconds = row
+        return _decode_value(value_json), fetched_at, ttl_seconds
+
+    def get_json_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        get_json for many keys: memory layer first, then a single SELECT for all remaining keys.
+        Returns only the keys that are present and not expired.
+        """
+        now = int(time.time())
+        out: Dict[str, Dict[str, Any]] = {}
+        pending: Dict[int, str] = {}
+        for key in keys:
+            value = _MEMORY_CACHE.get((self.cache_db_path, key), now)
+            if value is not None:
+                out[key] = value
+            else:
+                pending[_key_hash(key)] = key
+        if not pending:
+            return out
+
+        self._maybe_sweep(now)
+        con = self._get_conn()
+        rows = con.execute(CACHE_GET_MANY_SQL, (orjson.dumps(list(pending)), now))
+        for key_hash, row_key, value_json, fetched_at, ttl_seconds in rows:
+            key = pending.get(key_hash)
+            if key is None or key != row_key:
+                continue
+            value = _decode_value(value_json)
+            _MEMORY_CACHE.put((self.cache_db_path, key), value, fetched_at + ttl_seconds + 1, fetched_at)
+            out[key] = value
+        return out
 
     def set_json(self, key: str, value: Dict[str, Any], ttl_seconds: int) -> None:
-        con = self._connect()
-        try:
-            con.execute(
-                """
-                INSERT INTO cache(key, value_json, fetched_at, ttl_seconds)
-                VALUES(?, ?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                  value_json=excluded.value_json,
-                  fetched_at=excluded.fetched_at,
-                  ttl_seconds=excluded.ttl_seconds
-                """,
-                (key, json.dumps(value), int(time.time()), int(ttl_seconds)),
-            )
-            con.commit()
-        finally:
-            con.close()
+        now = int(time.time())
+        # encode outside the write lock (as set_json_many does) so other writers only wait for the upsert
+        blob, value = _encode_cache_value(value)
+        row = (_key_hash(key), key, blob, now, int(ttl_seconds))
+        with self._write_lock:
+            self._get_cursor().execute(CACHE_UPSERT_SQL, row)
+        _MEMORY_CACHE.put((self.cache_db_path, key), value, now + int(ttl_seconds) + 1, now)
+
+    def set_json_many(self, items: Iterable[Tuple[str, Dict[str, Any], int]]) -> None:
+        """
+        Upsert many (key, value, ttl_seconds) entries with one transaction per SET_MANY_CHUNK
+        entries: one commit per chunk instead of one per key, and a huge or streamed input
+        never has more than one chunk encoded in memory.
+        """
+        now = int(time.time())
+        for chunk in _chunked(items, SET_MANY_CHUNK):
+            # encode outside the write lock so other writers are only blocked for the insert
+            rows = []
+            mem_values = []
+            for key, value, ttl_seconds in chunk:
+                blob, mem_value = _encode_cache_value(value)
+                rows.append((_key_hash(key), key, blob, now, int(ttl_seconds)))
+                mem_values.append(mem_value)
+            with self._write_transaction() as con:
+                con.executemany(CACHE_UPSERT_SQL, rows)
+            for (key, _, ttl_seconds), mem_value in zip(chunk, mem_values):
+                _MEMORY_CACHE.put((self.cache_db_path, key), mem_value, now + int(ttl_seconds) + 1, now)
 
     # ---------- Snapshot helpers ----------
-    def save_snapshot(self, snapshot_type: str, country: str, params: Dict[str, Any], rows: list[Dict[str, Any]]) -> None:
-        con = self._connect()
+    def save_snapshot(
+        self, snapshot_type: str, country: str, params: Dict[str, Any], rows: Iterable[Dict[str, Any]]
+    ) -> "Future[int]":
+        """
+        Queue a snapshot for the background writer and return at once. The writer stores it with
+        save_snapshots, batched with whatever else is queued; the Future resolves to the snapshot_id
+        (a cancelled Future is skipped). `params` and `rows` are read later on the writer thread, so
+        do not mutate them afterwards. Call flush() to wait for queued snapshots; anything still
+        queued at interpreter exit is written before the process ends.
+        """
+        fut: "Future[int]" = Future()
+        self._uses_writer = True
+        _SNAPSHOT_WRITER.submit((self, fut, (snapshot_type, country, params, rows)))
+        return fut
+
+    def save_snapshots(
+        self, items: Iterable[Tuple[str, Dict[str, Any], Dict[str, Any], Iterable[Dict[str, Any]]]]
+    ) -> list[int]:
+        """
+        Store many (snapshot_type, country, params, rows) items synchronously, in a single transaction,
+        so the whole batch costs one commit. Returns the new snapshot_ids in order.
+        """
+        snapshot_ids: list[int] = []
+        created_at = int(time.time())
+        with self._write_transaction() as con:
+            for snapshot_type, country, params, rows in items:
+                snapshot_id = con.execute(
+                    SNAPSHOT_INSERT_SQL,
+                    (
+                        created_at,
+                        snapshot_type,
+                        country,
+                        orjson.dumps(params, option=orjson.OPT_NON_STR_KEYS),
+                        b"[]",
+                    ),
+                ).lastrowid
+                con.executemany(
+                    SNAPSHOT_ROW_INSERT_SQL,
+                    (
+                        (snapshot_id, i, _encode_value(chunk))
+                        for i, chunk in enumerate(_chunked(rows, SNAPSHOT_ROWS_PER_BLOB))
+                    ),
+                )
+                snapshot_ids.append(int(snapshot_id))
+        return snapshot_ids
+
+    def _write_batch(self, taken: list) -> None:
+        """
+        Runs on the writer thread: store this Storage's (future, args) items in one transaction.
+        A None future is a close() request for the writer thread's connection.
+        """
+        # Drop cancelled items, and read each rows iterable exactly once, up front, so the
+        # one-by-one retry below writes the same rows as the batch attempt.
+        batch = []
+        close_conn = False
+        for fut, args in taken:
+            if fut is None:
+                close_conn = True
+                continue
+            snapshot_type, country, params, rows = args
+            try:
+                if not fut.set_running_or_notify_cancel():
+                    continue
+            except RuntimeError:  # already resolved by the caller
+                continue
+            try:
+                batch.append((fut, (snapshot_type, country, params, list(rows))))
+            except Exception as exc:
+                _settle(fut, exc=exc)
+
         try:
-            con.execute(
-                """
-                INSERT INTO snapshots(created_at, snapshot_type, country, params_json, rows_json)
-                VALUES(?, ?, ?, ?, ?)
-                """,
-                (
-                    int(time.time()),
-                    snapshot_type,
-                    country,
-                    json.dumps(params),
-                    json.dumps(rows),
-                ),
-            )
-            con.commit()
-        finally:
+            snapshot_ids = self.save_snapshots([args for _, args in batch])
+        except Exception:
+            # the batch rolled back; write items one by one so a bad snapshot only fails itself
+            for fut, args in batch:
+                try:
+                    snapshot_id = self.save_snapshots([args])[0]
+                except Exception as exc:
+                    _settle(fut, exc=exc)
+                else:
+                    _settle(fut, result=snapshot_id)
+        else:
+            for (fut, _), snapshot_id in zip(batch, snapshot_ids):
+                _settle(fut, result=snapshot_id)
+        if close_conn:
+            self._close_conn()
+
+    def flush(self) -> None:
+        """
+        Block until every snapshot queued so far has been written (or failed). The writer is
+        shared, so this also waits for snapshots other Storage objects queued before the call.
+        """
+        if self._uses_writer:
+            _SNAPSHOT_WRITER.join()
+
+    def close(self) -> None:
+        """Write out queued snapshots, then close the writer thread's and this thread's connections."""
+        if self._uses_writer:
+            self._uses_writer = False
+            _SNAPSHOT_WRITER.submit((self, None, None))
+            _SNAPSHOT_WRITER.join()
+        self._close_conn()
+
+    def _close_conn(self) -> None:
+        con = getattr(self._local, "con", None)
+        if con is not None:
+            self._local.cur.close()
             con.close()
+            self._local.con = None
+            self._local.cur = None
+
+    def get_snapshot_rows(self, snapshot_id: int) -> list[Dict[str, Any]]:
+        """Rows of a snapshot in insertion order (older snapshots keep theirs inline in rows_json)."""
+        con = self._get_conn()
+        head = con.execute(SNAPSHOT_HEAD_SQL, (int(snapshot_id),)).fetchone()
+        if not head:
+            return []
+        rows = orjson.loads(head[0])
+        for (row_blob,) in con.execute(SNAPSHOT_ROWS_SQL, (int(snapshot_id),)):
+            chunk = _decode_value(row_blob)
+            # a chunk is a list of rows; blobs written before chunking hold a single row
+            if isinstance(chunk, list):
+                rows.extend(chunk)
+            else:
+                rows.append(chunk)
+        return rows